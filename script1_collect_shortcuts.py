@@ -1,6 +1,7 @@
 # script1_collect_shortcuts.py
 
 import os
+from collections import deque
 
 def get_start_menu_shortcuts():
     start_menu_paths = [
@@ -16,22 +17,35 @@ def get_start_menu_shortcuts():
 
     return shortcut_entries
 
+def sorted_directory_entries(path):
+    # Get a sorted list of entries in the directory
+    # (scandir carries the file type along, so no extra stat per entry)
+    with os.scandir(path) as it:
+        return sorted(it, key=lambda e: e.name)  # Sort alphabetically to match Start Menu display
+
 def traverse_directory(current_path, entries_list, base_path):
-    # Get a sorted list of entries in the current directory
-    entries = os.listdir(current_path)
-    entries.sort()  # Sort alphabetically to match Start Menu display
-
-    for entry in entries:
-        full_path = os.path.join(current_path, entry)
-        relative_path = os.path.relpath(full_path, base_path)
-
-        if os.path.isdir(full_path):
-            # Add folder entry (optional)
-            entries_list.append(f"[Folder] {relative_path}")
-            # Recursively traverse subdirectories
-            traverse_directory(full_path, entries_list, base_path)
-        elif os.path.isfile(full_path) and entry.lower().endswith('.lnk'):
-            entries_list.append(full_path)
+    base_path_len = len(base_path) + 1
+
+    # Walk depth-first with an explicit stack of entry iterators instead of
+    # recursing; each folder's contents are emitted right after the folder
+    # itself, in the same order the recursive version produced.
+    stack = deque([iter(sorted_directory_entries(current_path))])
+
+    while stack:
+        for entry in stack[-1]:
+            full_path = entry.path
+
+            if entry.is_dir(follow_symlinks=False):
+                # Add folder entry (optional)
+                entries_list.append(f"[Folder] {full_path[base_path_len:]}")
+                # Descend into the subdirectory before continuing with siblings
+                stack.append(iter(sorted_directory_entries(full_path)))
+                break
+            elif entry.name[-4:].lower() == '.lnk' and entry.is_file(follow_symlinks=False):
+                entries_list.append(full_path)
+        else:
+            # Current directory exhausted
+            stack.pop()
 
 def save_shortcuts_to_file(shortcuts, file_path):
     with open(file_path, 'w', encoding='utf-8') as f:
@@ -1,8 +1,12 @@
 # script2_collect_executables.py
 
 import os
+import struct
 import sys
-import win32com.client
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pythoncom
+from win32com.shell import shell, shellcon
 import tkinter as tk
 from tkinter import filedialog
 
@@ -11,19 +15,117 @@ def load_shortcuts_from_file(file_path):
         print(f"Shortcuts file not found at {file_path}.")
         return None
 
+    return read_lines(file_path)
+
+def read_lines(file_path):
+    # Yield lines one at a time instead of materializing the whole file
     with open(file_path, 'r', encoding='utf-8') as f:
-        shortcuts = [line.strip() for line in f]
-    return shortcuts
+        for line in f:
+            yield line.rstrip('\n')
+
+# Number of threads resolving shortcut targets concurrently
+MAX_WORKERS = 16
+
+# COM objects are apartment-local, so each worker thread keeps its own
+# IShellLink instance and reloads it for every shortcut
+_thread_state = threading.local()
+
+# Resolve without UI, without rewriting the .lnk and without searching or
+# probing the network for a moved target
+RESOLVE_FLAGS = shellcon.SLR_NO_UI | shellcon.SLR_NOUPDATE | shellcon.SLR_NOSEARCH | shellcon.SLR_NOTRACK
+
+# [MS-SHLLINK] constants used by the pure-Python parser
+LNK_HEADER_SIZE = 0x4C
+LNK_CLSID = bytes.fromhex('0114020000000000c000000000000046')
+HAS_LINK_TARGET_ID_LIST = 0x0001
+HAS_LINK_INFO = 0x0002
+FORCE_NO_LINK_INFO = 0x0100
+HAS_DARWIN_ID = 0x1000
+VOLUME_ID_AND_LOCAL_BASE_PATH = 0x0001
+
+def read_c_string(data, offset, unicode=False):
+    if unicode:
+        end = offset
+        while data[end:end + 2] != b'\0\0':
+            if end + 2 > len(data):
+                raise ValueError("Unterminated string in shortcut file")
+            end += 2
+        return data[offset:end].decode('utf-16-le')
+    end = data.index(b'\0', offset)
+    return data[offset:end].decode('mbcs')
+
+def parse_lnk_target(shortcut_path):
+    # Read the local target path straight from the .lnk file. Returns None
+    # when there is no local base path (network-only or MSI advertised
+    # shortcuts), in which case the caller falls back to COM.
+    try:
+        with open(shortcut_path, 'rb') as f:
+            data = f.read()
+
+        header_size, clsid, link_flags = struct.unpack_from('<I16sI', data, 0)
+        if header_size != LNK_HEADER_SIZE or clsid != LNK_CLSID:
+            return None
+        if link_flags & HAS_DARWIN_ID or not link_flags & HAS_LINK_INFO or link_flags & FORCE_NO_LINK_INFO:
+            return None
+
+        offset = LNK_HEADER_SIZE
+        if link_flags & HAS_LINK_TARGET_ID_LIST:
+            id_list_size, = struct.unpack_from('<H', data, offset)
+            offset += 2 + id_list_size
+
+        (link_info_size, link_info_header_size, link_info_flags, _, local_base_path_offset,
+         _, common_path_suffix_offset) = struct.unpack_from('<7I', data, offset)
+        if not link_info_flags & VOLUME_ID_AND_LOCAL_BASE_PATH:
+            return None
+
+        if link_info_header_size >= 0x24:
+            local_base_path_offset_unicode, common_path_suffix_offset_unicode = struct.unpack_from('<2I', data, offset + 28)
+            if local_base_path_offset_unicode:
+                base = read_c_string(data, offset + local_base_path_offset_unicode, unicode=True)
+                suffix = read_c_string(data, offset + common_path_suffix_offset_unicode, unicode=True)
+                return (base + suffix) or None
+
+        base = read_c_string(data, offset + local_base_path_offset)
+        suffix = read_c_string(data, offset + common_path_suffix_offset)
+        return (base + suffix) or None
+    except (OSError, ValueError, struct.error, UnicodeDecodeError):
+        return None
+
+def get_shell_link():
+    link = getattr(_thread_state, 'link', None)
+    if link is None:
+        # COM must be initialized once on every thread that uses it
+        pythoncom.CoInitialize()
+        link = pythoncom.CoCreateInstance(shell.CLSID_ShellLink, None,
+                                          pythoncom.CLSCTX_INPROC_SERVER, shell.IID_IShellLink)
+        _thread_state.link = link
+    return link
 
 def get_shortcut_target(shortcut_path):
+    # Most shortcuts carry their local target in the LinkInfo block, which
+    # can be read without going through COM at all
+    target = parse_lnk_target(shortcut_path)
+    if target:
+        return target
+
     try:
-        shell = win32com.client.Dispatch("WScript.Shell")
-        shortcut = shell.CreateShortcut(shortcut_path)
-        return shortcut.Targetpath
+        link = get_shell_link()
+        link.QueryInterface(pythoncom.IID_IPersistFile).Load(shortcut_path, 0)
+        link.Resolve(0, RESOLVE_FLAGS)
+        # The raw path skips MSI expansion; environment variables are
+        # expanded here so the output matches what WScript.Shell returned
+        target, _ = link.GetPath(shellcon.SLGP_RAWPATH)
+        return os.path.expandvars(target)
     except Exception as e:
         print(f"Error resolving shortcut target for {shortcut_path}: {e}")
         return ''
 
+def resolve_entry(entry):
+    if entry.startswith("[Folder]"):
+        # It's a folder entry; preserve it
+        return entry
+    return get_shortcut_target(entry)
+
 def save_executables_to_file(executables, file_path):
     with open(file_path, 'w', encoding='utf-8') as f:
         for exe in executables:
@@ -43,18 +145,13 @@ def main():
     if shortcuts is None:
         sys.exit(1)
 
-    executables = []
-    for shortcut in shortcuts:
-        if shortcut.startswith("[Folder]"):
-            # It's a folder entry; preserve it
-            executables.append(shortcut)
-        elif shortcut:
-            exe_path = get_shortcut_target(shortcut)
-            executables.append(exe_path)
-
-    # Save the executables to a .txt file in the same order
+    # Resolve the shortcut targets in parallel; map() keeps the input order,
+    # so results are written out in the same order as the shortcuts
     executables_file = os.path.join(os.getcwd(), 'ExecutablePaths.txt')
-    save_executables_to_file(executables, executables_file)
+    entries = (shortcut for shortcut in shortcuts if shortcut)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        executables = executor.map(resolve_entry, entries)
+        save_executables_to_file(executables, executables_file)
     print(f"Executable paths saved to {executables_file}")
 
 if __name__ == '__main__':
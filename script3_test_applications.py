@@ -3,16 +3,16 @@
 import os
 import sys
 import time
-import psutil
+import win32gui
 import tkinter as tk
 from tkinter import filedialog, ttk
 from tkinter.scrolledtext import ScrolledText
-from pywinauto import Desktop
-from openpyxl import Workbook
-from openpyxl.utils import get_column_letter
-from openpyxl.styles import Alignment
 import logging
-import re
+import ctypes
+from ctypes import wintypes
+import queue
+import threading
+from collections import deque
 
 # Configure logging to file only for initial setup
 logging.basicConfig(level=logging.INFO, filename='application_test.log', filemode='w',
@@ -24,6 +24,48 @@ progress_label = None
 progress_bar = None
 log_text_widget = None
 
+# Log lines waiting to be written to the text widget, and UI refresh throttling
+pending_log_lines = deque()
+last_ui_refresh = 0.0
+UI_REFRESH_INTERVAL = 0.05  # Seconds, i.e. at most ~20 refreshes per second
+
+# Watcher that wakes the launch loop when a new window appears
+window_watcher = None
+
+# System processes that must never be terminated (lowercase names)
+SYSTEM_PROCESSES = frozenset({'svchost.exe', 'csrss.exe', 'wininit.exe', 'services.exe'})
+
+# Mapping of expected executable names to actual executable names (both lowercase,
+# so lookups and comparisons need no further normalization)
+EXECUTABLE_ALIASES = {
+    'cmd.exe': 'windowsterminal.exe',
+    'powershell.exe': 'windowsterminal.exe',
+    'wmplayer.exe': 'setup_wm.exe',
+    # Add other mappings if necessary
+}
+
+# Shared top-left alignment for every cell in the results sheet
+CELL_ALIGNMENT = None
+CELL_STYLE_NAME = 'topleft'
+
+# Single UIA desktop, only used to wrap the handles we actually inspect
+DESKTOP = None
+
+def import_heavy_modules():
+    # pywinauto, psutil and openpyxl take seconds to import, so they are only
+    # loaded once the user has picked the input files
+    global psutil, Desktop, Workbook, WriteOnlyCell, get_column_letter, Alignment, NamedStyle
+    global DESKTOP, CELL_ALIGNMENT
+    import psutil
+    from pywinauto import Desktop
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
+    from openpyxl.styles import Alignment, NamedStyle
+
+    DESKTOP = Desktop(backend="uia")
+    CELL_ALIGNMENT = Alignment(vertical='top', horizontal='left', wrap_text=True)
+
 def load_files(shortcuts_file_path, executables_file_path):
     if not os.path.exists(shortcuts_file_path):
         logging.error(f"Shortcuts file not found at {shortcuts_file_path}.")
@@ -33,27 +75,199 @@ def load_files(shortcuts_file_path, executables_file_path):
         logging.error(f"Executables file not found at {executables_file_path}.")
         return None, None
 
-    with open(shortcuts_file_path, 'r', encoding='utf-8') as f:
-        shortcuts = [line.strip() for line in f]
-
-    with open(executables_file_path, 'r', encoding='utf-8') as f:
-        executables = [line.strip() for line in f]
+    # Read both files in a single pass and close them right away; the pairs
+    # are kept so the progress bar knows the total up front
+    entries = list(iter_application_entries(shortcuts_file_path, executables_file_path))
 
-    # Filter out folder entries and ensure lengths match
-    filtered_shortcuts = []
-    filtered_executables = []
-
-    for shortcut, executable in zip(shortcuts, executables):
-        if not shortcut.startswith("[Folder]"):
-            filtered_shortcuts.append(shortcut)
-            filtered_executables.append(executable)
+    logging.info("Loaded shortcuts and executables files successfully.")
+    return entries, len(entries)
+
+def iter_application_entries(shortcuts_file_path, executables_file_path):
+    # Read both files in lockstep and skip folder entries, yielding
+    # (shortcut, executable) pairs without building intermediate lists
+    with open(shortcuts_file_path, 'r', encoding='utf-8') as shortcuts_f, \
+         open(executables_file_path, 'r', encoding='utf-8') as executables_f:
+        for shortcut, executable in zip(shortcuts_f, executables_f):
+            shortcut = shortcut.rstrip('\n')
+            if not shortcut.startswith("[Folder]"):
+                yield shortcut, executable.rstrip('\n')
+
+def collect_visible_window(hwnd, handles):
+    if win32gui.IsWindowVisible(hwnd):
+        handles.append(hwnd)
+    return True
+
+def get_window_handles():
+    # Enumerate top-level windows through Win32 rather than a full UIA walk
+    handles = []
+    win32gui.EnumWindows(collect_visible_window, handles)
+    return set(handles)
+
+# WinEvent constants for window creation notifications
+EVENT_OBJECT_CREATE = 0x8000
+EVENT_OBJECT_SHOW = 0x8002
+WINEVENT_OUTOFCONTEXT = 0x0000
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+GA_ROOT = 2
+WM_QUIT = 0x0012
+
+WinEventProc = ctypes.WINFUNCTYPE(None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+                                  wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD)
+
+user32 = ctypes.windll.user32
+kernel32 = ctypes.windll.kernel32
+user32.SetWinEventHook.restype = wintypes.HANDLE
+user32.SetWinEventHook.argtypes = [wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WinEventProc,
+                                   wintypes.DWORD, wintypes.DWORD, wintypes.DWORD]
+user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+user32.GetAncestor.restype = wintypes.HWND
+user32.GetAncestor.argtypes = [wintypes.HWND, wintypes.UINT]
+user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+kernel32.OpenProcess.restype = wintypes.HANDLE
+kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+kernel32.QueryFullProcessImageNameW.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR,
+                                                ctypes.POINTER(wintypes.DWORD)]
+kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.c_void_p]
+kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.c_void_p]
+
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+TH32CS_SNAPPROCESS = 0x00000002
+INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+MAX_IMAGE_PATH = 32768
+
+class WindowEventWatcher:
+    # Out-of-context WinEvent callbacks are delivered through the message
+    # queue of the thread that set the hook, so the hook lives on its own
+    # thread with a message loop and forwards top-level window handles to
+    # a queue the launch loop can block on.
+    def __init__(self):
+        self.events = queue.Queue()
+        self._thread_id = None
+        self._hooked = False
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._callback = WinEventProc(self._on_event)  # Keep a reference for the hook's lifetime
+
+    def start(self):
+        self._thread.start()
+        self._ready.wait()
+        # Logged here rather than on the hook thread, which must not reach Tk
+        if not self._hooked:
+            logging.warning("Could not install window event hook; falling back to polling.")
+
+    def stop(self):
+        if self._thread_id is not None:
+            user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+        self._thread.join(timeout=1)
+
+    def clear(self):
+        try:
+            while True:
+                self.events.get_nowait()
+        except queue.Empty:
+            pass
 
-    if len(filtered_shortcuts) != len(filtered_executables):
-        logging.error("The number of shortcuts and executables does not match after filtering.")
-        return None, None
+    def wait(self, timeout):
+        # Block until a new top-level window appears or the timeout expires
+        try:
+            self.events.get(timeout=timeout)
+        except queue.Empty:
+            return False
+        self.clear()
+        return True
+
+    def _on_event(self, hook, event, hwnd, id_object, id_child, event_thread, event_time):
+        # The hooked range also covers EVENT_OBJECT_DESTROY, which must not wake the loop
+        if event in (EVENT_OBJECT_CREATE, EVENT_OBJECT_SHOW) and id_object == OBJID_WINDOW and id_child == CHILDID_SELF and hwnd \
+                and user32.GetAncestor(hwnd, GA_ROOT) == hwnd:
+            self.events.put(hwnd)
+
+    def _run(self):
+        self._thread_id = kernel32.GetCurrentThreadId()
+        hook = user32.SetWinEventHook(EVENT_OBJECT_CREATE, EVENT_OBJECT_SHOW, None, self._callback,
+                                      0, 0, WINEVENT_OUTOFCONTEXT)
+        self._hooked = bool(hook)
+        self._ready.set()
+        if not hook:
+            return
+        try:
+            msg = wintypes.MSG()
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            user32.UnhookWinEvent(hook)
+
+class PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ('dwSize', wintypes.DWORD),
+        ('cntUsage', wintypes.DWORD),
+        ('th32ProcessID', wintypes.DWORD),
+        ('th32DefaultHeapID', ctypes.c_size_t),
+        ('th32ModuleID', wintypes.DWORD),
+        ('cntThreads', wintypes.DWORD),
+        ('th32ParentProcessID', wintypes.DWORD),
+        ('pcPriClassBase', wintypes.LONG),
+        ('dwFlags', wintypes.DWORD),
+        ('szExeFile', wintypes.WCHAR * wintypes.MAX_PATH),
+    ]
 
-    logging.info("Loaded shortcuts and executables files successfully.")
-    return filtered_shortcuts, filtered_executables
+def snapshot_processes():
+    # Return {pid: (parent_pid, name)} for every process from one Toolhelp snapshot
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if snapshot == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError()
+    processes = {}
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        found = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while found:
+            processes[entry.th32ProcessID] = (entry.th32ParentProcessID, entry.szExeFile)
+            found = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(snapshot)
+    return processes
+
+def get_window_process_id(hwnd):
+    pid = wintypes.DWORD()
+    user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+    return pid.value
+
+def get_process_image_path(pid):
+    # Same result as psutil.Process(pid).exe(), with a single limited-rights handle
+    process_handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not process_handle:
+        raise ctypes.WinError()
+    try:
+        buffer = ctypes.create_unicode_buffer(MAX_IMAGE_PATH)
+        size = wintypes.DWORD(MAX_IMAGE_PATH)
+        if not kernel32.QueryFullProcessImageNameW(process_handle, 0, buffer, ctypes.byref(size)):
+            raise ctypes.WinError()
+        return buffer.value
+    finally:
+        kernel32.CloseHandle(process_handle)
+
+def wait_for_window_event(timeout):
+    flush_ui(force=True)
+    if window_watcher is None:
+        time.sleep(timeout)
+    else:
+        window_watcher.wait(timeout)
+
+def wait_for_quiescence(processes_before, timeout):
+    # Wait until no processes remain beyond the given snapshot, up to timeout seconds
+    flush_ui(force=True)
+    deadline = time.time() + timeout
+    delay = 0.05
+    while set(psutil.pids()) - processes_before and time.time() < deadline:
+        time.sleep(min(delay, max(0, deadline - time.time())))
+        delay = min(delay * 2, 0.5)
 
 def handle_uac_prompt():
     try:
@@ -73,28 +287,38 @@ def kill_process_tree(pid, including_parent=True):
     try:
         parent = psutil.Process(pid)
         parent_name = parent.name()
-        if parent_name.lower() in ['svchost.exe', 'csrss.exe', 'wininit.exe', 'services.exe']:
+        if parent_name.lower() in SYSTEM_PROCESSES:
             logging.warning(f"Skipping termination of system process: PID {parent.pid}, Name {parent_name}")
             return terminated_executables
-        children = parent.children(recursive=True)
-        for child in children:
+        # psutil finds the descendants (it drops processes older than their
+        # parent, whose recorded parent PID has since been reused); their
+        # names come from a single process snapshot taken afterwards, so only
+        # children that have already exited are missing from it
+        descendants = parent.children(recursive=True)
+        processes = snapshot_processes()
+        children = []
+        child_names = {}
+        for child in descendants:
+            child_pid = child.pid
+            if child_pid not in processes:
+                continue
+            child_name = processes[child_pid][1]
+            if child_name.lower() in SYSTEM_PROCESSES:
+                logging.warning(f"Skipping termination of system process: PID {child_pid}, Name {child_name}")
+                continue
             try:
-                child_name = child.name()
-                if child_name.lower() in ['svchost.exe', 'csrss.exe', 'wininit.exe', 'services.exe']:
-                    logging.warning(f"Skipping termination of system process: PID {child.pid}, Name {child_name}")
-                    continue
-                logging.info(f"Terminating child process: PID {child.pid}, Name {child_name}")
+                logging.info(f"Terminating child process: PID {child_pid}, Name {child_name}")
                 child.terminate()
+                children.append(child)
+                child_names[child_pid] = child_name
                 terminated_executables.append(child_name)
             except psutil.NoSuchProcess:
                 pass
+        flush_ui(force=True)
         gone, still_alive = psutil.wait_procs(children, timeout=5)
         for child in still_alive:
             try:
-                child_name = child.name()
-                if child_name.lower() in ['svchost.exe', 'csrss.exe', 'wininit.exe', 'services.exe']:
-                    logging.warning(f"Skipping killing of system process: PID {child.pid}, Name {child_name}")
-                    continue
+                child_name = child_names[child.pid]
                 logging.info(f"Killing child process: PID {child.pid}, Name {child_name}")
                 child.kill()
                 terminated_executables.append(child_name)
@@ -104,6 +328,7 @@ def kill_process_tree(pid, including_parent=True):
             try:
                 logging.info(f"Terminating parent process: PID {parent.pid}, Name {parent_name}")
                 parent.terminate()
+                flush_ui(force=True)
                 parent.wait(5)
                 terminated_executables.append(parent_name)
             except psutil.NoSuchProcess:
@@ -133,15 +358,34 @@ def create_progress_window(total_apps):
 def update_progress_window(current_app_index, app_name):
     progress_label.config(text=f"Testing application {current_app_index}/{int(progress_bar['maximum'])}: {app_name}")
     progress_bar['value'] = current_app_index
-    progress_window.update_idletasks()
+    flush_ui(force=True)
 
 def log_to_text_widget(message):
     if log_text_widget is not None:
+        pending_log_lines.append(message)
+        flush_ui()
+
+def flush_ui(force=False):
+    # There is no mainloop while tests run, so refreshes are throttled by
+    # time: pending log lines are inserted in one batch and idle tasks are
+    # processed at most once per UI_REFRESH_INTERVAL. Callers force a flush
+    # before blocking waits so throttled lines are not held back through them
+    global last_ui_refresh
+    if progress_window is None:
+        return
+    now = time.monotonic()
+    if not force and now - last_ui_refresh < UI_REFRESH_INTERVAL:
+        return
+    last_ui_refresh = now
+
+    if pending_log_lines:
+        batch = '\n'.join(pending_log_lines)
+        pending_log_lines.clear()
         log_text_widget.configure(state='normal')
-        log_text_widget.insert(tk.END, message + '\n')
+        log_text_widget.insert(tk.END, batch + '\n')
         log_text_widget.see(tk.END)
         log_text_widget.configure(state='disabled')
-        progress_window.update_idletasks()
+    progress_window.update_idletasks()
 
 # Custom logging handler
 class TextWidgetHandler(logging.Handler):
@@ -165,15 +409,7 @@ def launch_and_test_application(shortcut_path, expected_exe_path, app_name):
         'Closed Windows': ''
     }
 
-    # Mapping of expected executable names to actual executable names
-    executable_aliases = {
-        'cmd.exe': 'WindowsTerminal.exe',
-        'powershell.exe': 'WindowsTerminal.exe',
-        'wmplayer.exe': 'setup_wm.exe',
-        # Add other mappings if necessary
-    }
-
-    actual_executable_name = executable_aliases.get(expected_executable_name, expected_executable_name)
+    actual_executable_name = EXECUTABLE_ALIASES.get(expected_executable_name, expected_executable_name)
 
     associated_window_titles = []
     terminated_executables = []  # List to store terminated executables
@@ -189,10 +425,14 @@ def launch_and_test_application(shortcut_path, expected_exe_path, app_name):
 
     try:
         # Record initial processes and windows
-        processes_before = {p.pid for p in psutil.process_iter(['pid'])}
-        windows_before = set(w.handle for w in Desktop(backend="uia").windows())
+        processes_before = set(psutil.pids())
+        windows_before = get_window_handles()
         logging.info("Recorded initial processes and windows.")
 
+        # Drop window events from before this launch
+        if window_watcher is not None:
+            window_watcher.clear()
+
         # Start the application using os.startfile()
         os.startfile(shortcut_path)
         logging.info(f"Launched application using shortcut: {shortcut_name}")
@@ -205,6 +445,8 @@ def launch_and_test_application(shortcut_path, expected_exe_path, app_name):
 
         application_window_found = False
         main_app_pid = None
+        exe_names_by_pid = {}  # Executable name per PID, so repeated polls don't re-query
+        expected_title = app_name.casefold()  # Case-insensitive literal match on window titles
 
         while time.time() - start_time < max_wait_time:
             # Check for UAC prompt
@@ -217,18 +459,20 @@ def launch_and_test_application(shortcut_path, expected_exe_path, app_name):
                 result['Closed Windows'] = '; '.join(set(closed_windows)) or 'None'
                 return result
 
-            windows_after = set(w.handle for w in Desktop(backend="uia").windows())
+            windows_after = get_window_handles()
             new_windows_handles = windows_after - windows_before
 
             # Try to find the expected window by executable name
             for handle in new_windows_handles:
                 try:
-                    window = Desktop(backend="uia").window(handle=handle)
-                    process_id = window.process_id()
-                    process = psutil.Process(process_id)
-                    exe_path = process.exe()
-                    if os.path.basename(exe_path).lower() == actual_executable_name.lower():
+                    process_id = get_window_process_id(handle)
+                    exe_name = exe_names_by_pid.get(process_id)
+                    if exe_name is None:
+                        exe_name = os.path.basename(get_process_image_path(process_id)).lower()
+                        exe_names_by_pid[process_id] = exe_name
+                    if exe_name == actual_executable_name:
                         # Application window found
+                        window = DESKTOP.window(handle=handle)
                         application_window_found = True
                         expected_window = window
                         main_app_pid = process_id
@@ -238,6 +482,7 @@ def launch_and_test_application(shortcut_path, expected_exe_path, app_name):
                         # Pause after application window is found
                         pause_after_found = 2  # Adjust as needed
                         logging.info(f"Pausing for {pause_after_found} seconds to allow application to fully initialize.")
+                        flush_ui(force=True)
                         time.sleep(pause_after_found)
                         break  # Exit the wait loop
                 except Exception as e:
@@ -248,22 +493,23 @@ def launch_and_test_application(shortcut_path, expected_exe_path, app_name):
                 break  # Exit the wait loop
 
             # If not found by executable name, try matching by window title
-            expected_title_pattern = re.escape(app_name)
             for handle in new_windows_handles:
                 try:
-                    window = Desktop(backend="uia").window(handle=handle)
-                    window_title = window.window_text()
-                    if re.search(expected_title_pattern, window_title, re.IGNORECASE):
+                    # Plain Win32 title read; the UIA wrapper is only built for a match
+                    window_title = win32gui.GetWindowText(handle)
+                    if expected_title in window_title.casefold():
                         # Application window found by title
+                        window = DESKTOP.window(handle=handle)
                         application_window_found = True
                         expected_window = window
-                        process_id = window.process_id()
+                        process_id = get_window_process_id(handle)
                         main_app_pid = process_id
                         associated_window_titles.append(window_title)
                         logging.info(f"Expected window detected by title: {window_title}")
                         # Pause after application window is found
                         pause_after_found = 2  # Adjust as needed
                         logging.info(f"Pausing for {pause_after_found} seconds to allow application to fully initialize.")
+                        flush_ui(force=True)
                         time.sleep(pause_after_found)
                         break  # Exit the wait loop
                 except Exception as e:
@@ -273,7 +519,7 @@ def launch_and_test_application(shortcut_path, expected_exe_path, app_name):
             if application_window_found:
                 break  # Exit the wait loop
 
-            time.sleep(poll_interval)  # Wait before checking again
+            wait_for_window_event(poll_interval)  # Wait for a new window, or poll again
 
         if not application_window_found:
             # No application window opened within the wait time
@@ -281,7 +527,7 @@ def launch_and_test_application(shortcut_path, expected_exe_path, app_name):
                 # Handle new windows even if they don't match the expected executable
                 for handle in new_windows_handles:
                     try:
-                        window = Desktop(backend="uia").window(handle=handle)
+                        window = DESKTOP.window(handle=handle)
                         window_title = window.window_text()
                         associated_window_titles.append(window_title)
                         window.close()
@@ -308,6 +554,7 @@ def launch_and_test_application(shortcut_path, expected_exe_path, app_name):
         # Wait an additional time to ensure the application has fully initialized
         additional_wait_time = 5  # Adjust as needed
         logging.info(f"Waiting an additional {additional_wait_time} seconds for application to fully initialize.")
+        flush_ui(force=True)
         time.sleep(additional_wait_time)
 
         # Attempt to close the expected application window
@@ -325,19 +572,19 @@ def launch_and_test_application(shortcut_path, expected_exe_path, app_name):
             terminated_executables.extend(terminated_execs)
 
         # Wait for processes to terminate
-        time.sleep(2)
+        wait_for_quiescence(processes_before, timeout=2)
 
         # Verify the system has returned to its initial state
-        processes_after = {p.pid for p in psutil.process_iter(['pid'])}
-        new_pids = processes_after - processes_before
+        processes_after = snapshot_processes()
+        new_pids = processes_after.keys() - processes_before
 
         for pid in new_pids:
+            proc_name = processes_after[pid][1]
+            if proc_name.lower() in SYSTEM_PROCESSES:
+                logging.warning(f"Skipping termination of system process: PID {pid}, Name {proc_name}")
+                continue
             try:
                 proc = psutil.Process(pid)
-                proc_name = proc.name()
-                if proc_name.lower() in ['svchost.exe', 'csrss.exe', 'wininit.exe', 'services.exe']:
-                    logging.warning(f"Skipping termination of system process: PID {pid}, Name {proc_name}")
-                    continue
                 logging.warning(f"Process PID {pid} ({proc_name}) is still running after test.")
                 # Attempt to terminate remaining processes
                 proc.terminate()
@@ -345,13 +592,13 @@ def launch_and_test_application(shortcut_path, expected_exe_path, app_name):
             except psutil.NoSuchProcess:
                 continue
 
-        windows_after = set(w.handle for w in Desktop(backend="uia").windows())
+        windows_after = get_window_handles()
         new_windows = windows_after - windows_before
 
         if new_windows:
             for handle in new_windows:
                 try:
-                    window = Desktop(backend="uia").window(handle=handle)
+                    window = DESKTOP.window(handle=handle)
                     window_title = window.window_text()
                     logging.warning(f"Window '{window_title}' is still open after test.")
                     window.close()
@@ -378,53 +625,46 @@ def launch_and_test_application(shortcut_path, expected_exe_path, app_name):
     return result
 
 def save_results_to_excel(results, file_path):
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Application Test Results"
+    # Write-only mode streams rows to disk instead of keeping every cell in memory
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Application Test Results")
+
+    # Register the top-left alignment once as a named style; cells then only
+    # reference it instead of each carrying its own Alignment
+    cell_style = NamedStyle(name=CELL_STYLE_NAME, alignment=CELL_ALIGNMENT)
+    wb.add_named_style(cell_style)
 
     # Include new headers
     headers = [
         'Name', 'Shortcut Path', 'Expected Executable', 'Associated Windows',
         'Terminated Executables', 'Closed Windows', 'Status', 'Remarks'
     ]
-    ws.append(headers)
-
-    for result in results:
-        ws.append([
-            result.get('Name', ''),
-            result.get('Shortcut Path', ''),
-            result.get('Expected Executable', ''),
-            result.get('Associated Windows', ''),
-            result.get('Terminated Executables', ''),
-            result.get('Closed Windows', ''),
-            result.get('Status', ''),
-            result.get('Remarks', '')
-        ])
-
-    # Adjust column widths for better readability
-    for i, column in enumerate(ws.columns, 1):
-        max_length = 0
-        column_letter = get_column_letter(i)
-        for cell in column:
-            try:
-                cell_value = str(cell.value)
-                if len(cell_value) > max_length:
-                    max_length = len(cell_value)
-            except:
-                pass
-        adjusted_width = (max_length + 2)
-        ws.column_dimensions[column_letter].width = adjusted_width
+    rows = [[result.get(header, '') for header in headers] for result in results]
+
+    # Adjust column widths for better readability; in write-only mode they
+    # have to be set before the first row is written
+    max_lengths = [len(header) for header in headers]
+    for row in rows:
+        for i, value in enumerate(row):
+            max_lengths[i] = max(max_lengths[i], len(str(value)))
+    for i, max_length in enumerate(max_lengths, 1):
+        ws.column_dimensions[get_column_letter(i)].width = max_length + 2
 
     # Set alignment for all cells to top-left
-    for row in ws.iter_rows():
-        for cell in row:
-            cell.alignment = Alignment(vertical='top', horizontal='left', wrap_text=True)
+    for row in [headers] + rows:
+        cells = []
+        for value in row:
+            cell = WriteOnlyCell(ws, value=value)
+            cell.style = CELL_STYLE_NAME
+            cells.append(cell)
+        ws.append(cells)
 
     wb.save(file_path)
     logging.info(f"Results saved to Excel file: {file_path}")
 
 def main():
     global text_handler  # Declare as global to add/remove handler
+    global window_watcher
 
     # Prompt the user to select the shortcuts and executables files
     root = tk.Tk()
@@ -443,13 +683,14 @@ def main():
         print("No executables file selected.")
         sys.exit(1)
 
+    import_heavy_modules()
+
     # Load files before creating progress window
-    shortcuts, executables = load_files(shortcuts_file, executables_file)
-    if shortcuts is None or executables is None:
+    entries, total_apps = load_files(shortcuts_file, executables_file)
+    if entries is None:
         sys.exit(1)
 
     # Create progress window
-    total_apps = len(shortcuts)
     create_progress_window(total_apps)
 
     # Set up custom logging handler after GUI is initialized
@@ -458,18 +699,27 @@ def main():
     text_handler.setFormatter(formatter)
     logging.getLogger().addHandler(text_handler)
 
+    # Start listening for window creation before the first launch
+    window_watcher = WindowEventWatcher()
+    window_watcher.start()
+
     results = []
 
-    for index, (shortcut_path, exe_path) in enumerate(zip(shortcuts, executables), start=1):
+    for index, (shortcut_path, exe_path) in enumerate(entries, start=1):
         app_name = os.path.basename(shortcut_path).replace('.lnk', '')
         print(f"Testing application: {app_name}")
         logging.info(f"Testing application: {app_name}")
 
         update_progress_window(index, app_name)
 
+        processes_before = set(psutil.pids())
         result = launch_and_test_application(shortcut_path, exe_path, app_name)
         results.append(result)
-        time.sleep(2)
+        # Move on as soon as the processes started by the test have exited
+        wait_for_quiescence(processes_before, timeout=2)
+
+    window_watcher.stop()
+    window_watcher = None
 
     # Close progress window
     progress_window.destroy()
@@ -9,22 +9,182 @@ from tkinter import filedialog, ttk, messagebox
 from tkinter.scrolledtext import ScrolledText
 from pywinauto import Desktop
 from openpyxl import Workbook
-from openpyxl.styles import Alignment
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, NamedStyle
+from openpyxl.utils import get_column_letter
 import logging
 import threading
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import queue
+import ctypes
+from ctypes import wintypes
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
 import yaml
+import copy
+import functools
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+@functools.lru_cache(maxsize=16)
+def _parse_yaml_file(path: str, mtime: float, size: int) -> dict:
+    """Parse a YAML file; mtime and size are part of the cache key only."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+def load_yaml_cached(path: str) -> dict:
+    """Parse a YAML file, reusing the previous result while the file is unchanged."""
+    st = os.stat(path)
+    # Hand out a copy so callers cannot corrupt the cached data
+    return copy.deepcopy(_parse_yaml_file(path, st.st_mtime, st.st_size))
+
+# GUI refresh: interval between main-thread pumps and maximum log lines per pump
+GUI_PUMP_INTERVAL_MS = 50
+LOG_BATCH_SIZE = 200
+
+kernel32 = ctypes.windll.kernel32
+kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.c_void_p]
+kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.c_void_p]
+kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+kernel32.OpenProcess.restype = wintypes.HANDLE
+kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+kernel32.CreateJobObjectW.argtypes = [ctypes.c_void_p, wintypes.LPCWSTR]
+kernel32.SetInformationJobObject.argtypes = [wintypes.HANDLE, ctypes.c_int, ctypes.c_void_p, wintypes.DWORD]
+kernel32.AssignProcessToJobObject.argtypes = [wintypes.HANDLE, wintypes.HANDLE]
+kernel32.WaitForSingleObject.restype = wintypes.DWORD
+kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+kernel32.GetProcessId.restype = wintypes.DWORD
+kernel32.GetProcessId.argtypes = [wintypes.HANDLE]
+
+user32 = ctypes.windll.user32
+user32.WaitForInputIdle.restype = wintypes.DWORD
+user32.WaitForInputIdle.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+
+shell32 = ctypes.windll.shell32
+
+TH32CS_SNAPPROCESS = 0x00000002
+INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+PROCESS_TERMINATE = 0x0001
+PROCESS_SET_QUOTA = 0x0100
+JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE = 0x00002000
+JOB_OBJECT_EXTENDED_LIMIT_INFORMATION_CLASS = 9
+SEE_MASK_NOCLOSEPROCESS = 0x00000040
+SW_SHOWNORMAL = 1
+WAIT_OBJECT_0 = 0x00000000
+WAIT_TIMEOUT = 0x00000102
+
+class PROCESSENTRY32W(ctypes.Structure):
+    """Toolhelp process entry (tlhelp32.h)."""
+    _fields_ = [
+        ('dwSize', wintypes.DWORD),
+        ('cntUsage', wintypes.DWORD),
+        ('th32ProcessID', wintypes.DWORD),
+        ('th32DefaultHeapID', ctypes.c_size_t),
+        ('th32ModuleID', wintypes.DWORD),
+        ('cntThreads', wintypes.DWORD),
+        ('th32ParentProcessID', wintypes.DWORD),
+        ('pcPriClassBase', wintypes.LONG),
+        ('dwFlags', wintypes.DWORD),
+        ('szExeFile', wintypes.WCHAR * wintypes.MAX_PATH),
+    ]
+
+class IO_COUNTERS(ctypes.Structure):
+    """I/O accounting block embedded in the job limit information (winnt.h)."""
+    _fields_ = [
+        ('ReadOperationCount', ctypes.c_ulonglong),
+        ('WriteOperationCount', ctypes.c_ulonglong),
+        ('OtherOperationCount', ctypes.c_ulonglong),
+        ('ReadTransferCount', ctypes.c_ulonglong),
+        ('WriteTransferCount', ctypes.c_ulonglong),
+        ('OtherTransferCount', ctypes.c_ulonglong),
+    ]
+
+class JOBOBJECT_BASIC_LIMIT_INFORMATION(ctypes.Structure):
+    """Basic job object limits (winnt.h)."""
+    _fields_ = [
+        ('PerProcessUserTimeLimit', wintypes.LARGE_INTEGER),
+        ('PerJobUserTimeLimit', wintypes.LARGE_INTEGER),
+        ('LimitFlags', wintypes.DWORD),
+        ('MinimumWorkingSetSize', ctypes.c_size_t),
+        ('MaximumWorkingSetSize', ctypes.c_size_t),
+        ('ActiveProcessLimit', wintypes.DWORD),
+        ('Affinity', ctypes.c_size_t),
+        ('PriorityClass', wintypes.DWORD),
+        ('SchedulingClass', wintypes.DWORD),
+    ]
+
+class JOBOBJECT_EXTENDED_LIMIT_INFORMATION(ctypes.Structure):
+    """Extended job object limits (winnt.h)."""
+    _fields_ = [
+        ('BasicLimitInformation', JOBOBJECT_BASIC_LIMIT_INFORMATION),
+        ('IoInfo', IO_COUNTERS),
+        ('ProcessMemoryLimit', ctypes.c_size_t),
+        ('JobMemoryLimit', ctypes.c_size_t),
+        ('PeakProcessMemoryUsed', ctypes.c_size_t),
+        ('PeakJobMemoryUsed', ctypes.c_size_t),
+    ]
+
+class SHELLEXECUTEINFOW(ctypes.Structure):
+    """Parameters for ShellExecuteExW (shellapi.h)."""
+    _fields_ = [
+        ('cbSize', wintypes.DWORD),
+        ('fMask', wintypes.ULONG),
+        ('hwnd', wintypes.HWND),
+        ('lpVerb', wintypes.LPCWSTR),
+        ('lpFile', wintypes.LPCWSTR),
+        ('lpParameters', wintypes.LPCWSTR),
+        ('lpDirectory', wintypes.LPCWSTR),
+        ('nShow', ctypes.c_int),
+        ('hInstApp', wintypes.HINSTANCE),
+        ('lpIDList', ctypes.c_void_p),
+        ('lpClass', wintypes.LPCWSTR),
+        ('hkeyClass', wintypes.HKEY),
+        ('dwHotKey', wintypes.DWORD),
+        ('hIconOrMonitor', wintypes.HANDLE),
+        ('hProcess', wintypes.HANDLE),
+    ]
+
+shell32.ShellExecuteExW.argtypes = [ctypes.POINTER(SHELLEXECUTEINFOW)]
+
+@dataclass(slots=True)
+class AppResult:
+    """Outcome of testing a single application."""
+    name: str
+    shortcut: str
+    expected_executable: str
+    status: str = 'Not Tested'
+    remarks: str = ''
+    associated_windows: List[str] = field(default_factory=list)
+    terminated: Set[str] = field(default_factory=set)
+    closed: Set[str] = field(default_factory=set)
+
+    def as_row(self) -> Tuple[str, ...]:
+        """Return the Excel row; collected names are only joined here."""
+        return (
+            self.name, self.shortcut, self.expected_executable,
+            '; '.join(self.associated_windows) or 'None',
+            '; '.join(self.terminated) or 'None',
+            '; '.join(self.closed) or 'None',
+            self.status, self.remarks
+        )
 
 class ApplicationTester:
     """Class to test launching and closing of applications."""
     
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, log_to_file: bool = True):
+        self.config_path = config_path
         self.load_config(config_path)
-        self.configure_logging()
+        self.configure_logging(log_to_file)
         self.shortcuts: List[str] = []
         self.executables: List[str] = []
-        self.results: List[dict] = []
+        self.results: List[AppResult] = []
         self.testing_paused = False
         self.testing_cancelled = False
         self.progress_window = None
@@ -34,13 +194,24 @@ class ApplicationTester:
         self.text_handler = None
         self.pause_button = None
         self.cancel_button = None
+        self._desktop = Desktop(backend="uia")
+        self._log_queue = queue.SimpleQueue()
+        # Events from the test thread; only the Tk main thread touches widgets
+        self._gui_queue = queue.SimpleQueue()
+        self._last_windows_set = set()  # Top-level window handles captured before the latest launch
+        # Set in pool workers: only clean up processes/windows of the tested app's own tree
+        self.isolate_app_tree = False
 
     def load_config(self, config_path: str):
         """Load configuration from a YAML file."""
         try:
-            with open(config_path, 'r') as f:
-                self.config = yaml.safe_load(f)
-            self.excluded_processes = [proc.lower() for proc in self.config.get('excluded_processes', [])]
+            self.config = load_yaml_cached(config_path)
+            self.excluded_processes = frozenset(proc.lower() for proc in self.config.get('excluded_processes', []))
+            self.max_wait_time = self.config.get('max_wait_time', 20)
+            self.poll_interval = self.config.get('poll_interval', 2)
+            self.pause_after_found = self.config.get('pause_after_found', 2)
+            self.additional_wait_time = self.config.get('additional_wait_time', 5)
+            self.parallel_workers = self.config.get('parallel_workers', 1)
         except FileNotFoundError:
             messagebox.showerror("Error", f"Configuration file not found: {config_path}")
             sys.exit(1)
@@ -48,15 +219,15 @@ class ApplicationTester:
             messagebox.showerror("Error", f"Error parsing configuration file: {e}")
             sys.exit(1)
 
-    def configure_logging(self):
+    def configure_logging(self, log_to_file: bool = True):
         """Set up logging based on configuration."""
+        handlers = [logging.StreamHandler(sys.stdout)]
+        if log_to_file:
+            handlers.insert(0, logging.FileHandler(self.config.get('log_file', 'application_test.log'), mode='w'))
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.config.get('log_file', 'application_test.log'), mode='w'),
-                logging.StreamHandler(sys.stdout)
-            ]
+            handlers=handlers
         )
 
     def load_files(self, shortcuts_file_path: str, executables_file_path: str) -> bool:
@@ -72,28 +243,14 @@ class ApplicationTester:
                 messagebox.showerror("Error", f"Executables file not found at {executables_file_path}.")
                 return False
 
-            with open(shortcuts_file_path, 'r', encoding='utf-8') as f:
-                shortcuts = [line.strip() for line in f if line.strip()]
-
-            with open(executables_file_path, 'r', encoding='utf-8') as f:
-                executables = [line.strip() for line in f if line.strip()]
-
-            # Filter out folder entries and ensure lengths match
-            filtered_shortcuts = []
-            filtered_executables = []
-
-            for shortcut, executable in zip(shortcuts, executables):
-                if not shortcut.startswith("[Folder]"):
-                    filtered_shortcuts.append(shortcut)
-                    filtered_executables.append(executable)
-
-            if len(filtered_shortcuts) != len(filtered_executables):
-                logging.error("The number of shortcuts and executables does not match after filtering.")
-                messagebox.showerror("Error", "The number of shortcuts and executables does not match after filtering.")
-                return False
+            shortcuts = self.read_nonblank_lines(shortcuts_file_path)
+            executables = self.read_nonblank_lines(executables_file_path)
 
-            self.shortcuts = filtered_shortcuts
-            self.executables = filtered_executables
+            # Filter out folder entries while pairing; zip keeps both lists the same length
+            pairs = [(shortcut, executable) for shortcut, executable in zip(shortcuts, executables)
+                     if not shortcut.startswith("[Folder]")]
+            self.shortcuts = [shortcut for shortcut, _ in pairs]
+            self.executables = [executable for _, executable in pairs]
             logging.info("Loaded shortcuts and executables files successfully.")
             return True
 
@@ -102,6 +259,13 @@ class ApplicationTester:
             messagebox.showerror("Error", f"An error occurred while loading files: {e}")
             return False
 
+    @staticmethod
+    def read_nonblank_lines(file_path: str) -> List[str]:
+        """Read a UTF-8 text file in one go and return its stripped, non-blank lines."""
+        with open(file_path, 'rb') as f:
+            lines = f.read().decode('utf-8').splitlines()
+        return [line for line in map(str.strip, lines) if line]
+
     def create_progress_window(self, total_apps: int):
         """Create a GUI window to display progress and logs."""
         self.progress_window = tk.Toplevel()
@@ -130,6 +294,9 @@ class ApplicationTester:
         self.cancel_button = tk.Button(button_frame, text="Cancel", command=self.cancel_testing)
         self.cancel_button.pack(side=tk.LEFT, padx=5)
 
+        # Apply queued progress updates and log lines periodically on the main thread
+        self.progress_window.after(GUI_PUMP_INTERVAL_MS, self._pump_gui)
+
     def pause_testing(self):
         """Toggle the paused state of the testing."""
         self.testing_paused = not self.testing_paused
@@ -147,22 +314,60 @@ class ApplicationTester:
             logging.info("Testing cancelled by user.")
 
     def update_progress_window(self, current_app_index: int, app_name: str):
-        """Update the progress bar and label."""
-        self.progress_label.config(text=f"Testing application {current_app_index}/{int(self.progress_bar['maximum'])}: {app_name}")
-        self.progress_bar['value'] = current_app_index
-        self.progress_window.update_idletasks()
+        """Queue a progress bar and label update for the GUI thread."""
+        self._gui_queue.put_nowait(('progress', current_app_index, app_name))
+
+    def finish_progress_window(self, show_message, title: str, message: str):
+        """Queue closing the progress window and showing a final message box."""
+        self._gui_queue.put_nowait(('done', show_message, title, message))
 
     def log_to_text_widget(self, message: str):
-        """Log messages to the GUI text widget."""
-        if self.log_text_widget is not None:
+        """Queue a message for the GUI text widget."""
+        self._log_queue.put_nowait(message)
+
+    def _pump_gui(self):
+        """Apply queued GUI events on the Tk main thread, then reschedule."""
+        finished = None
+        try:
+            while True:
+                event = self._gui_queue.get_nowait()
+                if event[0] == 'progress':
+                    _, current_app_index, app_name = event
+                    self.progress_label.config(text=f"Testing application {current_app_index}/{int(self.progress_bar['maximum'])}: {app_name}")
+                    self.progress_bar['value'] = current_app_index
+                else:
+                    finished = event
+        except queue.Empty:
+            pass
+
+        self._drain_log_queue()
+
+        if finished is not None:
+            # Not rescheduled, so no after() callback is pending when the window goes
+            _, show_message, title, message = finished
+            self.progress_window.destroy()
+            show_message(title, message)
+            return
+
+        self.progress_window.after(GUI_PUMP_INTERVAL_MS, self._pump_gui)
+
+    def _drain_log_queue(self):
+        """Write queued log messages to the text widget in one batch."""
+        batch = []
+        try:
+            while len(batch) < LOG_BATCH_SIZE:
+                batch.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if batch and self.log_text_widget is not None:
             self.log_text_widget.configure(state='normal')
-            self.log_text_widget.insert(tk.END, message + '\n')
+            self.log_text_widget.insert(tk.END, '\n'.join(batch) + '\n')
             self.log_text_widget.see(tk.END)
             self.log_text_widget.configure(state='disabled')
-            self.progress_window.update_idletasks()
 
     class TextWidgetHandler(logging.Handler):
-        """Custom logging handler that writes to the text widget."""
+        """Custom logging handler that queues records for the text widget."""
         def __init__(self, app_tester):
             super().__init__()
             self.app_tester = app_tester
@@ -175,11 +380,28 @@ class ApplicationTester:
         """Check if a process is a system process."""
         return proc_name.lower() in self.excluded_processes
 
-    def handle_uac_prompt(self) -> bool:
-        """Check for and handle UAC prompts."""
+    def snapshot_processes(self) -> Dict[int, Tuple[int, str]]:
+        """Return {pid: (parent_pid, name)} for all processes from one Toolhelp snapshot."""
+        snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+        if snapshot == INVALID_HANDLE_VALUE:
+            raise ctypes.WinError()
+        processes = {}
+        try:
+            entry = PROCESSENTRY32W()
+            entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+            found = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+            while found:
+                processes[entry.th32ProcessID] = (entry.th32ParentProcessID, entry.szExeFile)
+                found = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+        finally:
+            kernel32.CloseHandle(snapshot)
+        return processes
+
+    def handle_uac_prompt(self, ignore_pids: frozenset = frozenset()) -> bool:
+        """Check for and handle UAC prompts, ignoring prompts whose PID is in ignore_pids."""
         try:
-            for proc in psutil.process_iter(['pid', 'name']):
-                if proc.info['name'].lower() == 'consent.exe':
+            for pid, (_, proc_name) in self.snapshot_processes().items():
+                if proc_name.lower() == 'consent.exe' and pid not in ignore_pids:
                     logging.warning("Detected UAC prompt (Consent.exe is running).")
                     return True
             return False
@@ -187,6 +409,48 @@ class ApplicationTester:
             logging.error(f"Error detecting UAC prompt: {e}")
             return False
 
+    def terminate_with_job(self, processes: List[psutil.Process]) -> Optional[List[psutil.Process]]:
+        """Terminate processes by closing a kill-on-close job object they are assigned to.
+
+        Returns the processes that were terminated, skipping those that had
+        already exited, or None if the job could not be set up for every
+        process, in which case nothing was terminated and the caller falls
+        back to terminating them one by one.
+        """
+        job = kernel32.CreateJobObjectW(None, None)
+        if not job:
+            return None
+        try:
+            assigned = []
+            for proc in processes:
+                process_handle = kernel32.OpenProcess(PROCESS_SET_QUOTA | PROCESS_TERMINATE, False, proc.pid)
+                if not process_handle:
+                    if proc.is_running():
+                        return None
+                    continue
+                try:
+                    # The open handle pins the PID; make sure it still is the same process
+                    if not proc.is_running():
+                        continue
+                    if not kernel32.AssignProcessToJobObject(job, process_handle):
+                        return None
+                    assigned.append(proc)
+                finally:
+                    kernel32.CloseHandle(process_handle)
+
+            # Only arm kill-on-close once every process is in the job, so a failed
+            # setup leaves all of them running for the fallback path
+            info = JOBOBJECT_EXTENDED_LIMIT_INFORMATION()
+            info.BasicLimitInformation.LimitFlags = JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE
+            if not kernel32.SetInformationJobObject(job, JOB_OBJECT_EXTENDED_LIMIT_INFORMATION_CLASS,
+                                                    ctypes.byref(info), ctypes.sizeof(info)):
+                return None
+            return assigned
+        finally:
+            # Closing the only handle to the job terminates every assigned process
+            # once kill-on-close is set
+            kernel32.CloseHandle(job)
+
     def kill_process_tree(self, pid: int, including_parent: bool = True) -> List[str]:
         """Terminate a process and its child processes."""
         terminated_executables = []
@@ -197,32 +461,55 @@ class ApplicationTester:
                 logging.warning(f"Skipping termination of system process: PID {parent.pid}, Name {parent_name}")
                 return terminated_executables
 
+            # Resolve all child names from one process snapshot up front so the
+            # terminate loop below issues no per-child name lookups
             children = parent.children(recursive=True)
+            snapshot = self.snapshot_processes()
+            targets = []
+            child_names = {}
+            excluded_processes = self.excluded_processes
             for child in children:
+                if child.pid not in snapshot:
+                    continue
+                child_name = snapshot[child.pid][1]
+                if child_name.lower() in excluded_processes:
+                    logging.warning(f"Skipping termination of system process: PID {child.pid}, Name {child_name}")
+                    continue
+                targets.append(child)
+                child_names[child.pid] = child_name
+
+            # Fast path: tear the whole tree down in one step through a job object
+            tree = targets + [parent] if including_parent else targets
+            terminated = self.terminate_with_job(tree)
+            if terminated is not None:
+                for proc in terminated:
+                    if proc is parent:
+                        logging.info(f"Terminated parent process: PID {parent.pid}, Name {parent_name}")
+                        terminated_executables.append(parent_name)
+                    else:
+                        logging.info(f"Terminated child process: PID {proc.pid}, Name {child_names[proc.pid]}")
+                        terminated_executables.append(child_names[proc.pid])
+                # Returns as soon as the kernel has finished tearing the processes down
+                psutil.wait_procs(terminated, timeout=5)
+                return terminated_executables
+
+            for child in targets:
                 try:
-                    child_name = child.name()
-                    if self.is_system_process(child_name):
-                        logging.warning(f"Skipping termination of system process: PID {child.pid}, Name {child_name}")
-                        continue
-                    logging.info(f"Terminating child process: PID {child.pid}, Name {child_name}")
+                    logging.info(f"Terminating child process: PID {child.pid}, Name {child_names[child.pid]}")
                     child.terminate()
-                    terminated_executables.append(child_name)
+                    terminated_executables.append(child_names[child.pid])
                 except psutil.NoSuchProcess:
                     continue
                 except psutil.AccessDenied:
                     logging.error(f"Access denied when attempting to terminate process PID {child.pid}")
                     continue
 
-            gone, still_alive = psutil.wait_procs(children, timeout=5)
+            gone, still_alive = psutil.wait_procs(targets, timeout=5)
             for child in still_alive:
                 try:
-                    child_name = child.name()
-                    if self.is_system_process(child_name):
-                        logging.warning(f"Skipping killing of system process: PID {child.pid}, Name {child_name}")
-                        continue
-                    logging.info(f"Killing child process: PID {child.pid}, Name {child_name}")
+                    logging.info(f"Killing child process: PID {child.pid}, Name {child_names[child.pid]}")
                     child.kill()
-                    terminated_executables.append(child_name)
+                    terminated_executables.append(child_names[child.pid])
                 except psutil.NoSuchProcess:
                     continue
                 except psutil.AccessDenied:
@@ -246,21 +533,49 @@ class ApplicationTester:
             logging.exception(f"Error terminating process tree: {e}")
         return terminated_executables
 
-    def launch_and_test_application(self, shortcut_path: str, expected_exe_path: str, app_name: str) -> dict:
+    def start_shortcut(self, shortcut_path: str) -> Optional[int]:
+        """Open a shortcut like os.startfile and return a handle to the new process, if any."""
+        info = SHELLEXECUTEINFOW()
+        info.cbSize = ctypes.sizeof(SHELLEXECUTEINFOW)
+        info.fMask = SEE_MASK_NOCLOSEPROCESS
+        info.lpFile = shortcut_path
+        info.nShow = SW_SHOWNORMAL
+        if not shell32.ShellExecuteExW(ctypes.byref(info)):
+            raise ctypes.WinError()
+        # No handle when the request was handed to an already running instance
+        return info.hProcess
+
+    def launch_and_test_application(self, shortcut_path: str, expected_exe_path: str, app_name: str) -> 'AppResult':
         """Launch and test an individual application."""
         shortcut_name = os.path.basename(shortcut_path)
         expected_executable_name = os.path.basename(expected_exe_path).lower()
 
-        result = {
-            'Name': app_name,
-            'Shortcut Path': shortcut_name,
-            'Expected Executable': expected_executable_name,
-            'Status': 'Not Tested',
-            'Remarks': '',
-            'Associated Windows': '',
-            'Terminated Executables': '',
-            'Closed Windows': ''
-        }
+        result = AppResult(app_name, shortcut_name, expected_executable_name)
+
+        # Per-test caches: psutil.Process() opens the process to validate the
+        # pid, and name()/exe() are further syscalls whose results don't change
+        # for a live pid, so each pid is only queried once across poll ticks
+        proc_cache: Dict[int, psutil.Process] = {}
+        name_cache: Dict[int, str] = {}
+        exe_cache: Dict[int, str] = {}
+
+        def get_process(pid: int) -> psutil.Process:
+            proc = proc_cache.get(pid)
+            if proc is None:
+                proc = proc_cache[pid] = psutil.Process(pid)
+            return proc
+
+        def get_process_name(pid: int) -> str:
+            name = name_cache.get(pid)
+            if name is None:
+                name = name_cache[pid] = get_process(pid).name()
+            return name
+
+        def get_process_exe(pid: int) -> str:
+            exe = exe_cache.get(pid)
+            if exe is None:
+                exe = exe_cache[pid] = get_process(pid).exe()
+            return exe
 
         # Mapping of expected executable names to actual executable names
         executable_aliases = {
@@ -272,77 +587,129 @@ class ApplicationTester:
 
         actual_executable_name = executable_aliases.get(expected_executable_name, expected_executable_name)
 
-        associated_window_titles = []
-        terminated_executables = []
-        closed_windows = []
-
         logging.info(f"Starting test for application: {app_name}")
 
         if not os.path.exists(shortcut_path):
-            result['Status'] = 'Failed'
-            result['Remarks'] = f'Shortcut not found: {shortcut_name}'
+            result.status = 'Failed'
+            result.remarks = f'Shortcut not found: {shortcut_name}'
             logging.error(f"Shortcut not found: {shortcut_name}")
             return result
 
+        # In pool workers, the launched process and its descendants by PID and
+        # creation time; only these count as this test's windows and processes
+        app_tree: Dict[int, float] = {}
+
+        def update_app_tree():
+            children_by_parent = {}
+            for pid, (parent_pid, _) in self.snapshot_processes().items():
+                if pid not in app_tree and pid != parent_pid:
+                    children_by_parent.setdefault(parent_pid, []).append(pid)
+            pending = list(app_tree)
+            while pending:
+                parent_pid = pending.pop()
+                for pid in children_by_parent.get(parent_pid, ()):
+                    try:
+                        created = get_process(pid).create_time()
+                    except psutil.Error:
+                        continue
+                    # A process older than its recorded parent only carries a reused parent PID
+                    if pid not in app_tree and created >= app_tree[parent_pid]:
+                        app_tree[pid] = created
+                        pending.append(pid)
+
+        process_handle = None
         try:
             # Record initial processes and windows
-            processes_before = {p.pid for p in psutil.process_iter(['pid'])}
-            windows_before = set(w.handle for w in Desktop(backend="uia").windows())
+            processes_before = set(psutil.pids())
+            windows_before = set(w.handle for w in self._desktop.windows())
+            self._last_windows_set = windows_before
             logging.debug("Recorded initial processes and windows.")
 
             # Start the application
-            os.startfile(shortcut_path)
+            launch_time = time.time()
+            process_handle = self.start_shortcut(shortcut_path)
             logging.info(f"Launched application using shortcut: {shortcut_name}")
 
+            isolate_app_tree = self.isolate_app_tree
+            if isolate_app_tree and not process_handle:
+                # Nothing to scope the test to, so match like a sequential run would
+                logging.warning("Launch was handed to a running instance; matching windows and processes unscoped.")
+                isolate_app_tree = False
+            if isolate_app_tree:
+                # The open handle keeps the PID from being reused; the launch
+                # time is a lower bound for the process's creation time
+                app_tree[kernel32.GetProcessId(process_handle)] = launch_time
+                # Only a prompt that appears after this launch can belong to it
+                uac_ignore_pids = frozenset(processes_before)
+            else:
+                uac_ignore_pids = frozenset()
+
             # Wait for the application window
             start_time = time.time()
             application_window_found = False
             main_app_pid = None
 
-            max_wait_time = self.config.get('max_wait_time', 20)
-            poll_interval = self.config.get('poll_interval', 2)
-            pause_after_found = self.config.get('pause_after_found', 2)
-            additional_wait_time = self.config.get('additional_wait_time', 5)
+            max_wait_time = self.max_wait_time
+            poll_interval = self.poll_interval
+            pause_after_found = self.pause_after_found
+            additional_wait_time = self.additional_wait_time
+
+            # Per-app match inputs, computed once rather than per window per poll
+            title_pattern = re.compile(re.escape(app_name), re.IGNORECASE)
+            actual_exec_lower = actual_executable_name.lower()
+
+            # Until the launched GUI process is waiting for input, each poll waits
+            # on WaitForInputIdle instead of sleeping, so the next poll runs as
+            # soon as it has finished initializing
+            waiting_for_idle = bool(process_handle)
+
+            # Set once the launched process has exited; a launcher stub that hands
+            # off to another process gets one more poll for a window to show up
+            launcher_exited = False
+
+            # Owning process per new window handle, so repeated polls only re-read titles
+            window_pids: Dict[int, int] = {}
 
             while time.time() - start_time < max_wait_time:
                 if self.testing_cancelled:
                     logging.info("Testing process was cancelled by the user.")
-                    result['Status'] = 'Cancelled'
-                    result['Remarks'] = 'Testing cancelled by user.'
+                    result.status = 'Cancelled'
+                    result.remarks = 'Testing cancelled by user.'
                     return result
 
                 while self.testing_paused:
                     time.sleep(1)
 
-                if self.handle_uac_prompt():
+                if self.handle_uac_prompt(uac_ignore_pids):
                     logging.warning("Application triggered UAC prompt.")
-                    result.update({
-                        'Status': 'Manual Intervention Required',
-                        'Remarks': 'Application triggered UAC prompt.',
-                        'Associated Windows': 'User Account Control',
-                        'Terminated Executables': '; '.join(set(terminated_executables)) or 'None',
-                        'Closed Windows': '; '.join(set(closed_windows)) or 'None'
-                    })
+                    result.status = 'Manual Intervention Required'
+                    result.remarks = 'Application triggered UAC prompt.'
+                    result.associated_windows = ['User Account Control']
                     return result
 
-                windows_after = set(w.handle for w in Desktop(backend="uia").windows())
-                new_windows_handles = windows_after - windows_before
+                new_windows = [w for w in self._desktop.windows() if w.handle not in windows_before]
+                if isolate_app_tree and new_windows:
+                    update_app_tree()
 
-                # Try to find the expected window
-                for handle in new_windows_handles:
+                # Try to find the expected window; titles are re-read every poll
+                # since many apps only set their real caption after creating the window
+                for window in new_windows:
                     try:
-                        window = Desktop(backend="uia").window(handle=handle)
+                        process_id = window_pids.get(window.handle)
+                        if process_id is None:
+                            process_id = window_pids[window.handle] = window.process_id()
+                        if isolate_app_tree and process_id not in app_tree:
+                            # Not (yet) known to be ours; look at it again next poll
+                            continue
                         window_title = window.window_text()
-                        process_id = window.process_id()
-                        process = psutil.Process(process_id)
-                        exe_path = process.exe()
+                        exe_path = get_process_exe(process_id)
 
-                        if os.path.basename(exe_path).lower() == actual_executable_name.lower() or \
-                           re.search(re.escape(app_name), window_title, re.IGNORECASE):
+                        if os.path.basename(exe_path).lower() == actual_exec_lower or \
+                           title_pattern.search(window_title):
                             application_window_found = True
                             expected_window = window
                             main_app_pid = process_id
-                            associated_window_titles.append(window_title)
+                            result.associated_windows.append(window_title)
                             logging.info(f"Detected application window: {window_title}")
                             time.sleep(pause_after_found)
                             break
@@ -352,19 +719,33 @@ class ApplicationTester:
                 if application_window_found:
                     break
 
-                time.sleep(poll_interval)
+                if process_handle and kernel32.WaitForSingleObject(process_handle, 0) == WAIT_OBJECT_0:
+                    if launcher_exited:
+                        logging.info("Launched process exited without opening a window.")
+                        break
+                    launcher_exited = True
+                    # WaitForInputIdle returns at once for an exited process; sleep
+                    # instead so the grace poll gives the handed-off process time
+                    waiting_for_idle = False
+
+                if waiting_for_idle:
+                    waiting_for_idle = user32.WaitForInputIdle(process_handle, int(poll_interval * 1000)) == WAIT_TIMEOUT
+                else:
+                    time.sleep(poll_interval)
 
             if not application_window_found:
                 # Handle applications without windows
                 logging.warning("No application window detected. Attempting to handle background processes.")
-                processes_after = {p.pid for p in psutil.process_iter(['pid'])}
+                processes_after = set(psutil.pids())
                 new_pids = processes_after - processes_before
+                if isolate_app_tree:
+                    update_app_tree()
+                    new_pids &= app_tree.keys()
 
                 for pid in new_pids:
                     try:
-                        proc = psutil.Process(pid)
-                        proc_name = proc.name()
-                        if proc_name.lower() == actual_executable_name.lower():
+                        proc_name = get_process_name(pid)
+                        if proc_name.lower() == actual_exec_lower:
                             main_app_pid = pid
                             logging.info(f"Detected background process: PID {pid}, Name {proc_name}")
                             break
@@ -372,9 +753,9 @@ class ApplicationTester:
                         continue
 
                 if main_app_pid is None:
-                    result['Status'] = 'Failed'
-                    result['Remarks'] = 'Application did not open any windows or detectable processes.'
-                    logging.error(result['Remarks'])
+                    result.status = 'Failed'
+                    result.remarks = 'Application did not open any windows or detectable processes.'
+                    logging.error(result.remarks)
                     return result
 
             # Additional wait time
@@ -383,103 +764,110 @@ class ApplicationTester:
             # Close application window if found
             if application_window_found:
                 try:
+                    # Read the title once, before the window (and its UIA element) goes away
+                    expected_window_title = expected_window.window_text()
                     expected_window.close()
-                    closed_windows.append(expected_window.window_text())
-                    logging.info(f"Closed application window: {expected_window.window_text()}")
+                    result.closed.add(expected_window_title)
+                    logging.info(f"Closed application window: {expected_window_title}")
                 except Exception as e:
                     logging.error(f"Error closing application window: {e}")
 
+            # Remember the app's own process tree so pool workers only clean up
+            # what this test started, not apps being tested by other workers
+            if isolate_app_tree:
+                update_app_tree()
+            app_tree_pids = set(app_tree)
+
             # Terminate the application processes
             if main_app_pid:
                 terminated_execs = self.kill_process_tree(main_app_pid)
-                terminated_executables.extend(terminated_execs)
+                result.terminated.update(terminated_execs)
 
             # Wait for processes to terminate
             time.sleep(2)
 
             # Check for residual processes
-            processes_after = {p.pid for p in psutil.process_iter(['pid'])}
+            processes_after = set(psutil.pids())
             new_pids = processes_after - processes_before
+            if isolate_app_tree:
+                new_pids &= app_tree_pids
 
             for pid in new_pids:
                 try:
-                    proc = psutil.Process(pid)
-                    proc_name = proc.name()
+                    proc_name = get_process_name(pid)
                     if self.is_system_process(proc_name):
                         continue
                     logging.warning(f"Residual process detected: PID {pid}, Name {proc_name}")
-                    proc.terminate()
-                    terminated_executables.append(proc_name)
+                    get_process(pid).terminate()
+                    result.terminated.add(proc_name)
                 except psutil.NoSuchProcess:
                     continue
                 except psutil.AccessDenied:
                     logging.error(f"Access denied when attempting to terminate process PID {pid}")
 
-            # Check for residual windows
-            windows_after = set(w.handle for w in Desktop(backend="uia").windows())
-            new_windows = windows_after - windows_before
+            # Check for residual windows: one enumeration after teardown, diffed
+            # against the pre-launch snapshot, with wrappers looked up by handle
+            handle_map_after = {w.handle: w for w in self._desktop.windows()}
+            new_windows = handle_map_after.keys() - self._last_windows_set
 
             for handle in new_windows:
                 try:
-                    window = Desktop(backend="uia").window(handle=handle)
+                    window = handle_map_after[handle]
+                    if isolate_app_tree and window.process_id() not in app_tree_pids:
+                        continue
                     window_title = window.window_text()
                     logging.warning(f"Residual window detected: {window_title}")
                     window.close()
-                    closed_windows.append(window_title)
+                    result.closed.add(window_title)
                 except Exception:
                     continue
 
             # Update result
-            result.update({
-                'Status': 'Success',
-                'Remarks': 'Application tested successfully.',
-                'Associated Windows': '; '.join(associated_window_titles) or 'None',
-                'Terminated Executables': '; '.join(set(terminated_executables)) or 'None',
-                'Closed Windows': '; '.join(set(closed_windows)) or 'None'
-            })
+            result.status = 'Success'
+            result.remarks = 'Application tested successfully.'
 
         except Exception as e:
-            result['Status'] = 'Failed'
-            result['Remarks'] = f'Exception occurred: {e}'
+            result.status = 'Failed'
+            result.remarks = f'Exception occurred: {e}'
             logging.exception(f"Exception during testing: {e}")
+        finally:
+            if process_handle:
+                kernel32.CloseHandle(process_handle)
 
         return result
 
-    def save_results_to_excel(self, results: List[dict], file_path: str):
+    def save_results_to_excel(self, results: List['AppResult'], file_path: str):
         """Save test results to an Excel file."""
         try:
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Application Test Results"
+            # Write-only mode streams rows out instead of keeping every cell in memory
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("Application Test Results")
 
-            headers = [
+            # One named style for every cell instead of an Alignment per cell
+            wrapped = NamedStyle(name='wrapped', alignment=Alignment(vertical='top', horizontal='left', wrap_text=True))
+            wb.add_named_style(wrapped)
+
+            headers = (
                 'Name', 'Shortcut Path', 'Expected Executable', 'Associated Windows',
                 'Terminated Executables', 'Closed Windows', 'Status', 'Remarks'
-            ]
-            ws.append(headers)
-
-            for result in results:
-                ws.append([
-                    result.get('Name', ''),
-                    result.get('Shortcut Path', ''),
-                    result.get('Expected Executable', ''),
-                    result.get('Associated Windows', ''),
-                    result.get('Terminated Executables', ''),
-                    result.get('Closed Windows', ''),
-                    result.get('Status', ''),
-                    result.get('Remarks', '')
-                ])
-
-            # Adjust column widths
-            for col in ws.columns:
-                max_length = max(len(str(cell.value)) for cell in col) + 2
-                col_letter = col[0].column_letter
-                ws.column_dimensions[col_letter].width = max_length
-
-            # Set alignment
-            for row in ws.iter_rows():
-                for cell in row:
-                    cell.alignment = Alignment(vertical='top', horizontal='left', wrap_text=True)
+            )
+            rows = [headers] + [result.as_row() for result in results]
+
+            # A write-only sheet needs its column widths before the first row
+            col_widths = [len(header) for header in headers]
+            for row in rows:
+                for i, value in enumerate(row):
+                    col_widths[i] = max(col_widths[i], len(str(value)))
+            for i, width in enumerate(col_widths, 1):
+                ws.column_dimensions[get_column_letter(i)].width = width + 2
+
+            for row in rows:
+                cells = []
+                for value in row:
+                    cell = WriteOnlyCell(ws, value=value)
+                    cell.style = 'wrapped'
+                    cells.append(cell)
+                ws.append(cells)
 
             wb.save(file_path)
             logging.info(f"Results saved to Excel file: {file_path}")
@@ -487,48 +875,103 @@ class ApplicationTester:
         except Exception as e:
             logging.error(f"Error saving results to Excel: {e}")
 
+    def run_tests_sequentially(self):
+        """Test the applications one after another in this process."""
+        for index, (shortcut_path, exe_path) in enumerate(zip(self.shortcuts, self.executables), start=1):
+            if self.testing_cancelled:
+                logging.info("Testing process was cancelled by the user.")
+                break
+
+            while self.testing_paused:
+                time.sleep(1)
+
+            app_name = os.path.basename(shortcut_path).replace('.lnk', '')
+            logging.info(f"Testing application: {app_name}")
+
+            self.update_progress_window(index, app_name)
+
+            result = self.launch_and_test_application(shortcut_path, exe_path, app_name)
+            self.results.append(result)
+            time.sleep(1)
+
+    def run_tests_in_parallel(self):
+        """Test the applications in a pool of worker processes."""
+        jobs = [(shortcut_path, exe_path, os.path.basename(shortcut_path).replace('.lnk', ''))
+                for shortcut_path, exe_path in zip(self.shortcuts, self.executables)]
+        results: List[Optional[AppResult]] = [None] * len(jobs)
+
+        pending_jobs = iter(enumerate(jobs))
+        jobs_exhausted = False
+        futures = {}
+        completed = 0
+
+        with ProcessPoolExecutor(max_workers=self.parallel_workers) as executor:
+            while True:
+                # Submit one job per free worker, so pausing stops new tests from starting;
+                # after a cancel, tests already running are still collected below
+                while not jobs_exhausted and not self.testing_paused and not self.testing_cancelled \
+                        and len(futures) < self.parallel_workers:
+                    try:
+                        index, (shortcut_path, exe_path, app_name) = next(pending_jobs)
+                    except StopIteration:
+                        jobs_exhausted = True
+                        break
+                    future = executor.submit(test_application_in_worker, self.config_path, shortcut_path, exe_path, app_name)
+                    futures[future] = index
+
+                if not futures:
+                    if jobs_exhausted or self.testing_cancelled:
+                        break
+                    # Paused with no tests in flight
+                    time.sleep(1)
+                    continue
+
+                done, _ = wait(futures, timeout=1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = futures.pop(future)
+                    app_name = jobs[index][2]
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        logging.exception(f"Worker failed while testing {app_name}: {e}")
+                        results[index] = AppResult(app_name, os.path.basename(jobs[index][0]),
+                                                   os.path.basename(jobs[index][1]).lower(),
+                                                   status='Failed', remarks=f'Exception occurred: {e}')
+                    completed += 1
+                    logging.info(f"Finished testing application: {app_name} ({results[index].status})")
+                    self.update_progress_window(completed, app_name)
+
+            if self.testing_cancelled:
+                logging.info("Testing process was cancelled by the user.")
+
+        # Keep the input order; tests never started after a cancel have no result
+        self.results.extend(result for result in results if result is not None)
+
     def run_tests(self):
-        """Run the application tests."""
+        """Run the application tests; called on the test thread."""
         try:
-            total_apps = len(self.shortcuts)
-            self.create_progress_window(total_apps)
-
             # Set up custom logging handler after GUI is initialized
             self.text_handler = self.TextWidgetHandler(self)
             formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
             self.text_handler.setFormatter(formatter)
             logging.getLogger().addHandler(self.text_handler)
 
-            for index, (shortcut_path, exe_path) in enumerate(zip(self.shortcuts, self.executables), start=1):
-                if self.testing_cancelled:
-                    logging.info("Testing process was cancelled by the user.")
-                    break
-
-                while self.testing_paused:
-                    time.sleep(1)
-
-                app_name = os.path.basename(shortcut_path).replace('.lnk', '')
-                logging.info(f"Testing application: {app_name}")
+            if self.parallel_workers > 1:
+                self.run_tests_in_parallel()
+            else:
+                self.run_tests_sequentially()
 
-                self.update_progress_window(index, app_name)
-
-                result = self.launch_and_test_application(shortcut_path, exe_path, app_name)
-                self.results.append(result)
-                time.sleep(1)
-
-            # Close progress window
-            self.progress_window.destroy()
             # Remove the custom logging handler
             logging.getLogger().removeHandler(self.text_handler)
 
             # Save results
             self.save_results_to_excel(self.results, self.config.get('excel_output', 'Application_Test_Results.xlsx'))
             logging.info("Testing completed.")
-            messagebox.showinfo("Completed", f"Testing completed. Results saved to {self.config.get('excel_output', 'Application_Test_Results.xlsx')}")
+            self.finish_progress_window(messagebox.showinfo, "Completed", f"Testing completed. Results saved to {self.config.get('excel_output', 'Application_Test_Results.xlsx')}")
 
         except Exception as e:
             logging.exception(f"Error during testing: {e}")
-            messagebox.showerror("Error", f"An error occurred during testing: {e}")
+            self.finish_progress_window(messagebox.showerror, "Error", f"An error occurred during testing: {e}")
 
     def main(self):
         """Main function to execute the application testing."""
@@ -558,11 +1001,20 @@ class ApplicationTester:
         if not self.load_files(shortcuts_file, executables_file):
             sys.exit(1)
 
+        # Build the progress window here so all Tk calls stay on the main thread
+        self.create_progress_window(len(self.shortcuts))
+
         # Run tests in a separate thread to keep GUI responsive
         test_thread = threading.Thread(target=self.run_tests)
         test_thread.start()
         root.mainloop()
 
+def test_application_in_worker(config_path: str, shortcut_path: str, expected_exe_path: str, app_name: str) -> 'AppResult':
+    """Test a single application in a pool worker process."""
+    tester = ApplicationTester(config_path, log_to_file=False)
+    tester.isolate_app_tree = True
+    return tester.launch_and_test_application(shortcut_path, expected_exe_path, app_name)
+
 if __name__ == '__main__':
     tester = ApplicationTester('config.yaml')
     tester.main()